@@ -4,6 +4,7 @@ from __future__ import annotations
 import importlib.util
 from dataclasses import dataclass
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Optional
 
 import numpy as np
@@ -27,13 +28,36 @@ _provider = RandomMarketDataProvider(seed=42) if RandomMarketDataProvider else N
 _loader = DataLoader(_provider) if _provider and DataLoader else None
 
 
+@lru_cache(maxsize=32)
+def _cached_market_snapshot(as_of: date) -> MarketContainer:
+    """Load one snapshot per date; the container is shared, so callers must not mutate it."""
+
+    return _loader.load(as_of=as_of)
+
+
 def _market_snapshot(as_of: Optional[date] = None) -> Optional[MarketContainer]:
-    """Build a qfinlib MarketContainer when dependencies are present."""
+    """Build a qfinlib MarketContainer when dependencies are present.
+
+    Snapshots are cached per calendar date so repeated dashboard callbacks do
+    not rebuild the same market.
+    """
 
     if not _loader:
         return None
 
-    return _loader.load(as_of=as_of)
+    return _cached_market_snapshot(as_of or date.today())
+
+
+def cache_stats() -> dict[str, Optional[float]]:
+    """Return hit/miss counters for the market snapshot cache."""
+
+    info = _cached_market_snapshot.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": info.hits / lookups if lookups else None,
+    }
 
 
 def _geometric_brownian_walk(periods: int, start: float, drift: float, vol: float, seed: Optional[int]) -> pd.Series:
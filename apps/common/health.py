@@ -0,0 +1,17 @@
+"""Health endpoint shared by the qfinlib Dash tools."""
+from __future__ import annotations
+
+from dash import Dash
+from flask import jsonify
+
+from apps.common.data import cache_stats
+
+HEALTH_PATH = "/health"
+
+
+def register_health_route(app: Dash) -> None:
+    """Expose ``/health`` on the app's Flask server for the portal to probe."""
+
+    @app.server.route(HEALTH_PATH)
+    def health():
+        return jsonify({"status": "ok", "app": app.title, "cache": cache_stats()})
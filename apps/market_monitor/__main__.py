@@ -6,11 +6,13 @@ import dash
 from dash import Dash, Input, Output, dcc, html
 
 from apps.common.data import load_equity_history
+from apps.common.health import register_health_route
 
 SYMBOLS = ["SPY", "QQQ", "GLD", "TLT", "BTC-USD"]
 
 app: Dash = dash.Dash(__name__)
 app.title = "Market Monitor"
+register_health_route(app)
 
 app.layout = html.Div(
     [
@@ -6,11 +6,13 @@ import dash
 from dash import Dash, Input, Output, dcc, html
 
 from apps.common.data import load_swap_curve
+from apps.common.health import register_health_route
 
 CURRENCIES = ["USD", "EUR", "GBP", "JPY"]
 
 app: Dash = dash.Dash(__name__)
 app.title = "Swap Rate Monitor"
+register_health_route(app)
 
 app.layout = html.Div(
     [
@@ -1,29 +1,199 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import os
+import threading
+import time
+import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from textwrap import dedent
+from typing import Optional
 
 import dash
-from dash import Dash, dcc, html
+from dash import Dash, Input, Output, dcc, html
+
+PROBE_TIMEOUT_S = float(os.getenv("PROBE_TIMEOUT_S", "2.0"))
+PROBE_INTERVAL_MS = int(os.getenv("PROBE_INTERVAL_MS", "15000"))
+SLOW_THRESHOLD_MS = float(os.getenv("SLOW_THRESHOLD_MS", "500"))
+
+
+def _app_link(name: str, description: str, env_prefix: str, default_port: int) -> dict[str, str]:
+    """Resolve browser-facing and probe URLs for a dashboard.
+
+    ``<PREFIX>_URL`` is the link opened by the user; ``<PREFIX>_INTERNAL_URL``
+    is where the portal reaches the app (e.g. a docker-compose service name).
+    """
+
+    href = os.getenv(f"{env_prefix}_URL", f"http://localhost:{default_port}").rstrip("/")
+    internal = os.getenv(f"{env_prefix}_INTERNAL_URL", href).rstrip("/")
+    return {
+        "name": name,
+        "description": description,
+        "href": href,
+        "health_url": f"{internal}/health",
+    }
+
 
 APP_LINKS = [
-    {
-        "name": "Market Monitor",
-        "description": "Intraday and historical monitoring of key symbols with charting and stats.",
-        "href": "http://localhost:8051",
-    },
-    {
-        "name": "Trade Pricing",
-        "description": "Option and structured trade pricing using qfinlib analytics.",
-        "href": "http://localhost:8052",
-    },
-    {
-        "name": "Strategy Lab",
-        "description": "Moving-average backtests and rapid strategy parameter sweeps.",
-        "href": "http://localhost:8053",
-    },
+    _app_link(
+        "Market Monitor",
+        "Intraday and historical monitoring of key symbols with charting and stats.",
+        "MARKET_MONITOR",
+        8051,
+    ),
+    _app_link(
+        "Swap Rate Monitor",
+        "Swap curve levels across major currencies.",
+        "SWAP_RATE_MONITOR",
+        8061,
+    ),
+    _app_link(
+        "Trade Pricing",
+        "Option and structured trade pricing using qfinlib analytics.",
+        "TRADE_PRICING",
+        8052,
+    ),
+    _app_link(
+        "Strategy Lab",
+        "Moving-average backtests and rapid strategy parameter sweeps.",
+        "STRATEGY_LAB",
+        8053,
+    ),
 ]
 
+
+# Long-lived pool so ``asyncio.run`` never joins threads stuck on a hung app;
+# urllib's timeout is per socket operation and does not cover DNS lookups.
+# At most one probe per app is in flight, so jobs never queue for a worker.
+_PROBE_EXECUTOR = ThreadPoolExecutor(max_workers=len(APP_LINKS), thread_name_prefix="portal-probe")
+_in_flight: dict[str, Future] = {}
+
+_results_lock = threading.Lock()
+_first_round = threading.Event()
+_latest_results: Optional[list[ProbeResult]] = None
+_poller: Optional[threading.Thread] = None
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    name: str
+    up: bool
+    latency_ms: Optional[float] = None
+    cache_hit_rate: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def slow(self) -> bool:
+        return self.up and self.latency_ms is not None and self.latency_ms > SLOW_THRESHOLD_MS
+
+
+def _fetch_health(url: str, timeout: float) -> tuple[object, float]:
+    start = time.perf_counter()
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        payload = json.load(response)
+    return payload, (time.perf_counter() - start) * 1000
+
+
+def _parse_health(name: str, payload: object, latency_ms: float) -> ProbeResult:
+    if not isinstance(payload, dict):
+        return ProbeResult(name=name, up=False, error=f"Unexpected health payload: {type(payload).__name__}")
+
+    cache = payload.get("cache")
+    hit_rate = cache.get("hit_rate") if isinstance(cache, dict) else None
+    if isinstance(hit_rate, bool) or not isinstance(hit_rate, (int, float)):
+        hit_rate = None
+
+    status = payload.get("status")
+    up = status == "ok"
+    return ProbeResult(
+        name=name,
+        up=up,
+        latency_ms=latency_ms,
+        cache_hit_rate=hit_rate,
+        error=None if up else f"Reported status: {status!r}",
+    )
+
+
+async def probe_app(link: dict[str, str], timeout: float = PROBE_TIMEOUT_S) -> ProbeResult:
+    """Hit an app's health endpoint and time the round trip."""
+
+    name = link["name"]
+    pending = _in_flight.get(name)
+    if pending is not None and not pending.done():
+        return ProbeResult(name=name, up=False, error="Previous probe still running")
+
+    future = _PROBE_EXECUTOR.submit(_fetch_health, link["health_url"], timeout)
+    _in_flight[name] = future
+    try:
+        payload, latency_ms = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+    except Exception as exc:  # any failure only marks this app's card as down
+        error = f"{type(exc).__name__}: {exc}".strip() if str(exc) else type(exc).__name__
+        return ProbeResult(name=name, up=False, error=error)
+
+    return _parse_health(name, payload, latency_ms)
+
+
+async def probe_all(links: list[dict[str, str]], timeout: float = PROBE_TIMEOUT_S) -> list[ProbeResult]:
+    """Probe every dashboard concurrently.
+
+    Each probe gives up after ``timeout`` seconds; a request still blocked in
+    its worker thread is abandoned rather than awaited.
+    """
+
+    return list(await asyncio.gather(*(probe_app(link, timeout) for link in links)))
+
+
+def _poll_forever() -> None:
+    global _latest_results
+    while True:
+        results = asyncio.run(probe_all(APP_LINKS))
+        with _results_lock:
+            _latest_results = results
+        _first_round.set()
+        time.sleep(PROBE_INTERVAL_MS / 1000)
+
+
+def _ensure_poller() -> None:
+    """Start the single background poller shared by every browser tab."""
+
+    global _poller
+    with _results_lock:
+        if _poller is None:
+            _poller = threading.Thread(target=_poll_forever, name="portal-poller", daemon=True)
+            _poller.start()
+
+
+def _status_badge(result: ProbeResult) -> html.Span:
+    if not result.up:
+        return html.Span("down", className="status status-down", title=result.error or "")
+    if result.slow:
+        return html.Span("slow", className="status status-slow")
+    return html.Span("up", className="status status-up")
+
+
+def _render_card(link: dict[str, str], result: Optional[ProbeResult]) -> html.Div:
+    if result is None:
+        badge = html.Span("checking…", className="status status-pending")
+        stats = "Probing…"
+    else:
+        badge = _status_badge(result)
+        latency = f"{result.latency_ms:.0f} ms" if result.latency_ms is not None else "n/a"
+        hit_rate = f"{result.cache_hit_rate:.0%}" if result.cache_hit_rate is not None else "n/a"
+        stats = f"Response: {latency} | Cache hit rate: {hit_rate}"
+
+    return html.Div(
+        [
+            html.Div([html.H3(link["name"]), badge], className="card-header"),
+            html.P(link["description"]),
+            html.P(stats, className="card-stats"),
+            html.A("Open", href=link["href"], className="btn"),
+        ],
+        className="card",
+    )
+
+
 app: Dash = dash.Dash(__name__)
 app.title = "qfinlib Toolkit Portal"
 
@@ -40,19 +210,11 @@ app.layout = html.Div(
             className="subtitle",
         ),
         html.Div(
-            [
-                html.Div(
-                    [
-                        html.H3(link["name"]),
-                        html.P(link["description"]),
-                        html.A("Open", href=link["href"], className="btn"),
-                    ],
-                    className="card",
-                )
-                for link in APP_LINKS
-            ],
+            [_render_card(link, None) for link in APP_LINKS],
+            id="card-grid",
             className="card-grid",
         ),
+        dcc.Interval(id="probe-interval", interval=PROBE_INTERVAL_MS, n_intervals=0),
         html.P(
             "Customize ports and images in docker-compose.yml if you need to align with existing infra.",
             className="footer-note",
@@ -62,11 +224,13 @@ app.layout = html.Div(
 )
 
 
-app.css.append_css(
-    {
-        "external_url": "https://cdnjs.cloudflare.com/ajax/libs/milligram/1.4.1/milligram.min.css"
-    }
-)
+@app.callback(Output("card-grid", "children"), Input("probe-interval", "n_intervals"))
+def refresh_status(_: int):
+    _ensure_poller()
+    _first_round.wait(PROBE_TIMEOUT_S + 1)
+    with _results_lock:
+        results = _latest_results or [None] * len(APP_LINKS)
+    return [_render_card(link, result) for link, result in zip(APP_LINKS, results)]
 
 
 def main() -> None:
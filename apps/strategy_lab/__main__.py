@@ -7,11 +7,13 @@ from dash import Dash, Input, Output, dcc, html
 import pandas as pd
 
 from apps.common.data import BacktestResult, run_moving_average_backtest
+from apps.common.health import register_health_route
 
 SYMBOLS = ["SPY", "QQQ", "EEM", "IWM"]
 
 app: Dash = dash.Dash(__name__)
 app.title = "Strategy Lab"
+register_health_route(app)
 
 app.layout = html.Div(
     [
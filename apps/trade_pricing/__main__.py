@@ -8,6 +8,7 @@ from dash import Dash, Input, Output, dcc, html
 from scipy.stats import norm
 
 from apps.common.data import load_option_surface
+from apps.common.health import register_health_route
 
 
 def black_scholes_call(spot: float, strike: float, rate: float, vol: float, maturity: float) -> float:
@@ -19,6 +20,7 @@ def black_scholes_call(spot: float, strike: float, rate: float, vol: float, matu
 
 app: Dash = dash.Dash(__name__)
 app.title = "Trade Pricing"
+register_health_route(app)
 
 app.layout = html.Div(
     [